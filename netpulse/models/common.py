@@ -43,6 +43,10 @@ class JobResult(BaseModel):
     error: Optional[Any] = None
 
     model_config = ConfigDict(
+        # Built once per finished job and never mutated; frozen lets
+        # pydantic skip per-instance __pydantic_fields_set__ bookkeeping
+        # on assignment and makes instances hashable.
+        frozen=True,
         json_schema_extra={
             "example": {
                 "type": 1,
@@ -52,7 +56,7 @@ class JobResult(BaseModel):
                     "message": "Something went wrong",
                 },
             }
-        }
+        },
     )
 
 
@@ -62,11 +66,19 @@ class NodeInfo(BaseModel):
     capacity: int
     queue: str
 
+    def model_post_init(self, __context):
+        # NodeInfo is used as a dict/set key in the scheduler. Identity is
+        # the (immutable in practice) hostname, so cache its hash once and
+        # bypass pydantic attribute resolution on every lookup.
+        object.__setattr__(self, "_h", hash(self.__dict__["hostname"]))
+
     def __hash__(self):
-        return hash(self.hostname)
+        return self._h
 
     def __eq__(self, value):
-        return self.hostname == value.hostname
+        if isinstance(value, NodeInfo):
+            return self.__dict__["hostname"] == value.__dict__["hostname"]
+        return NotImplemented
 
 
 class WebHook(BaseModel):
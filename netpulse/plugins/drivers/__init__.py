@@ -1,3 +1,5 @@
+import threading
+
 from ...models.request import PullingRequest, PushingRequest
 
 
@@ -6,6 +8,12 @@ class BaseDriver:
 
     driver_name: str = "base"
 
+    # Set by a driver when the worker process became useless (e.g. its
+    # persistent device connection died) and should retire. The worker
+    # watches this flag and stops cooperatively between jobs, instead of
+    # being torn down with a signal. Shared by all drivers in the process.
+    suicide_flag: threading.Event = threading.Event()
+
     @classmethod
     def from_pulling_request(cls, req: PullingRequest) -> "BaseDriver":
         """Create driver instance from a pulling request."""
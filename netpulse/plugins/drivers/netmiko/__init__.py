@@ -1,11 +1,15 @@
 import logging
 import os
-import signal
-import sys
+import re
 import threading
-from typing import Optional
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import ClassVar, Optional
 
+import orjson
 from netmiko import BaseConnection, ConnectHandler
+from netmiko.ssh_dispatcher import CLASS_MAPPER
 
 from .. import BaseDriver
 from .model import (
@@ -19,146 +23,364 @@ from .model import (
 log = logging.getLogger(__name__)
 
 
+@dataclass
+class _PooledSession:
+    """
+    A pooled netmiko session with its own monitor state.
+
+    Each entry owns its channel lock and keepalive bookkeeping, so sessions
+    to different devices never contend with each other. All entries share
+    one monitor thread (see NetmikoDriver._monitor_loop).
+    """
+
+    session: BaseConnection
+    conn_args: NetmikoConnectionArgs
+    key: tuple
+
+    # Guards individual I/O on the (not concurrency safe) netmiko channel
+    channel_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    # Set when the entry is torn down; the shared monitor skips it from
+    # then on
+    stop_event: threading.Event = field(default_factory=threading.Event)
+
+    # Timestamp of the last real traffic on the channel. The monitor skips
+    # its keepalive probe when a command already exercised the channel
+    # within the keepalive window, saving one round-trip per idle tick.
+    last_io: float = 0.0
+
+    # Number of commands currently on the channel. Plain int updates are
+    # GIL-atomic, so the monitor can read this without taking any lock
+    # and skip its probe while the worker is busy.
+    in_flight: int = 0
+
+
 class NetmikoDriver(BaseDriver):
     """
-    This driver has persistent connection support and monitor mechanism.
-    But it is not concurrency safe. Only use it with rq.SimpleWorker.
+    This driver keeps a small LRU pool of persistent connections (keyed by
+    device identity) with a single monitor thread keeping all pooled
+    sessions alive. It is not concurrency safe. Only use it with
+    rq.SimpleWorker.
+
+    NOTE on performance: send()/config() are network-I/O bound. Nearly all
+    wall time is spent inside session.send_command / send_config_set waiting
+    on the device's SSH channel, and each command in `send` costs one full
+    round-trip. Optimizations here should target round-trip count, connection
+    reuse rate and per-call pydantic overhead — not CPU throughput.
     """
 
     driver_name = "netmiko"
 
-    persisted_session: BaseConnection = None
-    persisted_conn_args: NetmikoConnectionArgs = None
+    # Lock ordering: _pool_lock -> entry.channel_lock, never the reverse.
+    # _pool_lock guards the pool dict itself; per-entry channel locks guard
+    # the actual device I/O.
+    _pool_lock = threading.Lock()
+    _pool: ClassVar["OrderedDict[tuple, _PooledSession]"] = OrderedDict()
+    _pool_cap = int(os.getenv("NETPULSE_NETMIKO_POOL", "8"))
 
-    _monitor_stop_event = None
-    _monitor_thread = None
-    _monitor_lock = threading.Lock()
+    # One daemon thread multiplexes keepalive for all pooled sessions
+    _monitor_thread: ClassVar[Optional[threading.Thread]] = None
+    _monitor_wakeup: ClassVar[threading.Event] = threading.Event()
+
+    # device_type -> resolved connection class, filled on first use
+    _device_cls_cache: ClassVar[dict] = {}
 
     @classmethod
-    def _get_persisted_session(cls, conn_args: NetmikoConnectionArgs) -> Optional[BaseConnection]:
+    def _connection_factory(cls, device_type: str):
         """
-        Check if persisted session is still alive, otherwise disconnect it.
+        Resolve the netmiko connection class for a device_type once and
+        reuse it, skipping ConnectHandler's string-keyed dispatch on every
+        connect. Unknown types fall back to ConnectHandler so its canonical
+        error message is preserved.
         """
-        if cls.persisted_session and cls.persisted_conn_args != conn_args:
-            if cls.persisted_session:
-                log.warning("New connection args detected, disconnecting old session")
-                # Stop monitor thread and disconnect
-                with cls._monitor_lock:
-                    try:
-                        cls.persisted_session.disconnect()
-                    except Exception as e:
-                        log.error(f"Error in disconnecting old session: {e}")
-                    finally:
-                        cls._set_persisted_session(None, None)
+        factory = cls._device_cls_cache.get(device_type)
+        if factory is None:
+            factory = CLASS_MAPPER.get(device_type, ConnectHandler)
+            cls._device_cls_cache[device_type] = factory
+        return factory
 
-        return cls.persisted_session
+    @classmethod
+    def _pool_key(cls, conn_args: NetmikoConnectionArgs) -> tuple:
+        """Identity of a device connection for pooling purposes."""
+        return conn_args._identity_key
 
     @classmethod
-    def _set_persisted_session(
-        cls, session: BaseConnection, conn_args: NetmikoConnectionArgs
-    ) -> Optional[BaseConnection]:
-        """
-        Persist session and connection args. Start monitor thread.
-        Caller should ensure that the session is disconnected when done.
-        """
-        # Clear
-        if session is None:
-            if cls.persisted_conn_args.keepalive:
-                cls._stop_monitor_thread()
-            cls.persisted_session = None
-            cls.persisted_conn_args = None
-            return None
+    def _get_pooled_session(cls, conn_args: NetmikoConnectionArgs) -> Optional[_PooledSession]:
+        """
+        Look up a live pooled session for these connection args (LRU refresh).
+        """
+        with cls._pool_lock:
+            entry = cls._pool.get(cls._pool_key(conn_args))
+            if entry:
+                cls._pool.move_to_end(entry.key)
+        return entry
+
+    @classmethod
+    def _put_pooled_session(cls, entry: _PooledSession):
+        """
+        Insert a session into the pool, evicting the least recently used
+        entry beyond capacity. Makes sure the shared monitor is running.
+        """
+        evicted = []
+        with cls._pool_lock:
+            cls._pool[entry.key] = entry
+            cls._pool.move_to_end(entry.key)
+            while len(cls._pool) > cls._pool_cap:
+                _, old = cls._pool.popitem(last=False)
+                evicted.append(old)
 
-        # Setup
-        cls.persisted_session = session
-        cls.persisted_conn_args = conn_args
-        cls._start_monitor_thread(cls.persisted_session)
+        for old in evicted:
+            log.info(f"Pool is full, evicting session to {old.conn_args.host}")
+            cls._teardown_entry(old)
 
-        return cls.persisted_session
+        if entry.conn_args.keepalive:
+            cls._ensure_monitor_thread()
+
+    @classmethod
+    def _teardown_entry(cls, entry: _PooledSession):
+        """
+        Retire a session: flag it for the monitor, then disconnect.
+        Caller should have already removed the entry from the pool and must
+        NOT hold _pool_lock. Setting the stop event first means the monitor
+        will not start a new probe on the entry; an in-progress probe holds
+        the channel lock, which the disconnect below waits for.
+        """
+        entry.stop_event.set()
+        try:
+            with entry.channel_lock:
+                entry.session.disconnect()
+        except Exception as e:
+            log.error(f"Error in disconnecting session to {entry.conn_args.host}: {e}")
 
     @classmethod
-    def _start_monitor_thread(cls, session: BaseConnection):
+    def _ensure_monitor_thread(cls):
+        """
+        Start the shared monitor thread on first use. One daemon thread
+        multiplexes keepalive for every pooled session (instead of a thread
+        per session), waking at the earliest per-entry deadline.
+        """
+        with cls._pool_lock:
+            if cls._monitor_thread and cls._monitor_thread.is_alive():
+                thread = None
+            else:
+                thread = threading.Thread(target=cls._monitor_loop, daemon=True)
+                cls._monitor_thread = thread
+
+        if thread:
+            thread.start()
+        else:
+            # A new session may have an earlier deadline than the current wait
+            cls._monitor_wakeup.set()
+
+    @classmethod
+    def _monitor_loop(cls):
         """
         session.is_alive() will send NULL to device. We rely on this to keepalive.
         However, BaseConnection is not concurrency safe, we have to use a lock.
         """
-        if cls._monitor_thread and cls._monitor_thread.is_alive():
-            log.info("Monitoring thread already running")
-            return
+        log.info("Monitoring thread started")
+
+        while True:
+            with cls._pool_lock:
+                entries = [e for e in cls._pool.values() if e.conn_args.keepalive]
+
+            if not entries:
+                # Park until a new session is pooled
+                cls._monitor_wakeup.wait()
+                cls._monitor_wakeup.clear()
+                continue
+
+            # Wake up at the earliest keepalive deadline since the last real
+            # traffic, not on a fixed period.
+            now = time.monotonic()
+            deadline = min(e.last_io + e.conn_args.keepalive for e in entries)
+            if deadline > now:
+                cls._monitor_wakeup.wait(timeout=deadline - now)
+                cls._monitor_wakeup.clear()
+                continue
+
+            dead_entries = []
+            for entry in entries:
+                if entry.stop_event.is_set():
+                    continue
+
+                # Lock-free fast path: a command is on the channel right now,
+                # which is the best liveness proof we can get. Advance the
+                # deadline too, or an overdue-but-busy entry would keep the
+                # loop spinning without waiting until the command finishes;
+                # send()/config() refresh last_io on completion anyway.
+                if entry.in_flight > 0:
+                    entry.last_io = time.monotonic()
+                    continue
+
+                # Real send()/config() traffic already kept the channel
+                # alive within the window; no probe needed this tick.
+                if time.monotonic() - entry.last_io < entry.conn_args.keepalive:
+                    continue
+
+                with entry.channel_lock:
+                    # Double checking
+                    if entry.stop_event.is_set():
+                        continue
 
-        cls._monitor_stop_event = threading.Event()
-        host = cls.persisted_conn_args.host
-        timeout = cls.persisted_conn_args.keepalive
+                    # Health check + keepalive in one probe
+                    if cls._probe_session(entry):
+                        entry.last_io = time.monotonic()
+                    else:
+                        log.warning(f"Connection to {entry.conn_args.host} is unhealthy")
+                        entry.stop_event.set()
+                        dead_entries.append(entry)
 
-        def monitor():
-            suicide = False
-            log.info(f"Monitoring thread started ({host})")
+            for entry in dead_entries:
+                cls._discard_dead_entry(entry)
 
-            while not cls._monitor_stop_event.is_set():
-                if cls._monitor_stop_event.wait(timeout=timeout):
-                    break
+    @classmethod
+    def _probe_session(cls, entry: _PooledSession) -> bool:
+        """
+        Check liveness with a single SSH2 MSG_IGNORE frame on the underlying
+        paramiko transport. That's one packet with no prompt interaction
+        (so it cannot race with command-reading state), versus the three
+        channel I/Os of is_alive() + clear_buffer() + write_channel().
 
-                with cls._monitor_lock:
-                    # Double checking
-                    if cls._monitor_stop_event.is_set():
-                        break
-
-                    # Health checking
-                    if not session.is_alive():
-                        log.warning(f"Connection to {host} is unhealthy")
-                        suicide = True
-                        cls._monitor_stop_event.set()
-                        break
-
-                    # Keepalive
-                    try:
-                        if junk := session.clear_buffer():
-                            log.debug(f"Detected junk data in keepalive: {junk}")
-                        session.write_channel(session.RETURN)
-                    except Exception as e:
-                        log.warning(f"Error in sending keepalive to {host}: {e}")
-                        suicide = True
-                        cls._monitor_stop_event.set()
-
-            log.debug(f"Monitoring thread quitting with `suicide={suicide}`.")
-
-            # When connection is disconnected, the worker should suicide.
-            if suicide:
-                log.info(f"Pinned worker for {host} suicides. ")
-                os.kill(os.getpid(), signal.SIGTERM)
-
-            # This only exits from current thread
-            sys.exit(0)
-
-        cls._monitor_thread = threading.Thread(target=monitor, daemon=True)
-        cls._monitor_thread.start()
+        NOTE: Caller must own the channel lock.
+        """
+        session = entry.session
+        host = entry.conn_args.host
+
+        try:
+            transport = session.remote_conn.transport
+        except AttributeError:
+            transport = None
+
+        if transport is not None:
+            try:
+                transport.send_ignore()
+                return transport.is_active()
+            except Exception as e:
+                log.warning(f"Error in sending keepalive to {host}: {e}")
+                return False
+
+        # Non-paramiko transports (telnet/serial): channel-level fallback
+        try:
+            if not session.is_alive():
+                return False
+            if junk := session.clear_buffer():
+                log.debug(f"Detected junk data in keepalive: {junk}")
+            session.write_channel(session.RETURN)
+            return True
+        except Exception as e:
+            log.warning(f"Error in sending keepalive to {host}: {e}")
+            return False
+
+    @classmethod
+    def _discard_dead_entry(cls, entry: _PooledSession):
+        """
+        Drop a session whose connection died under the monitor.
+        When the last pooled session is gone, the worker should suicide
+        (a pinned worker without its device connection is useless).
+        """
+        with cls._pool_lock:
+            if cls._pool.get(entry.key) is entry:
+                del cls._pool[entry.key]
+            pool_empty = len(cls._pool) == 0
+
+        try:
+            with entry.channel_lock:
+                entry.session.disconnect()
+        except Exception as e:
+            log.debug(f"Error in disconnecting dead session: {e}")
+
+        if pool_empty:
+            log.info(f"Pinned worker for {entry.conn_args.host} suicides. ")
+            # Cooperative: the worker stops between jobs instead of being
+            # torn down by SIGTERM (see BaseDriver.suicide_flag).
+            cls.suicide_flag.set()
 
     @classmethod
-    def _stop_monitor_thread(cls):
-        """Stop the monitor thread."""
-        if cls._monitor_stop_event:
-            cls._monitor_stop_event.set()
-        if cls._monitor_thread and cls._monitor_thread.is_alive():
-            cls._monitor_thread.join()
-        cls._monitor_thread = None
-        cls._monitor_stop_event = None
+    def prewarm(cls, conn_args_list: list[NetmikoConnectionArgs]):
+        """
+        Build connections for upcoming jobs in background daemon threads and
+        park them in the pool, so connect() finds a ready session instead of
+        paying the multi-second SSH handshake on the job path.
+
+        Sessions are process-local: this only helps when called from the
+        worker process that will run the jobs (e.g. with the next few queued
+        hosts). Args without keepalive or already pooled are skipped.
+        """
+
+        def warm(ca: NetmikoConnectionArgs):
+            try:
+                factory = cls._connection_factory(ca.device_type)
+                session = factory(**orjson.loads(ca.model_dump_json(exclude_none=True)))
+                entry = _PooledSession(
+                    session=session,
+                    conn_args=ca,
+                    key=cls._pool_key(ca),
+                    last_io=time.monotonic(),
+                )
+                cls._put_pooled_session(entry)
+                log.info(f"Prewarmed connection to {ca.host}")
+            except Exception as e:
+                log.warning(f"Error in prewarming connection to {ca.host}: {e}")
+
+        for ca in conn_args_list:
+            if not ca.keepalive or cls._get_pooled_session(ca):
+                continue
+            threading.Thread(target=warm, args=(ca,), daemon=True).start()
+
+    @classmethod
+    def _coerce_connection_args(cls, conn_args) -> NetmikoConnectionArgs:
+        """
+        Upgrade the generic connection args of a request to the Netmiko-typed
+        model. The API boundary only validates the loose DriverConnectionArgs
+        (netmiko fields travel as untyped extras), so this is where string
+        ports, keepalives etc. get coerced to their real types. Validating
+        the flat scalar dict directly is cheap and still avoids the full
+        request dump + re-parse round-trip.
+        """
+        if isinstance(conn_args, NetmikoConnectionArgs):
+            return conn_args
+
+        data = {**conn_args.__dict__, **(conn_args.__pydantic_extra__ or {})}
+        return NetmikoConnectionArgs.model_validate(data)
 
     @classmethod
     def from_pulling_request(cls, req: NetmikoPullingRequest):
-        # Pydantic don't have implicit conversion, we have to do it explicitly
-        if not isinstance(req, NetmikoPullingRequest):
-            req = NetmikoPullingRequest.model_validate(obj=req.model_dump())
-        return cls(args=req.args, conn_args=req.connection_args, enabled=req.enable_mode)
+        # Pydantic don't have implicit conversion, we have to do it explicitly.
+        # Instead of re-validating the whole request into a
+        # NetmikoPullingRequest, only the pieces the driver consumes are
+        # coerced: connection args as a flat dict, args via `from_attributes`
+        # (which reads fields incl. extras directly).
+        if isinstance(req, NetmikoPullingRequest):
+            return cls(args=req.args, conn_args=req.connection_args, enabled=req.enable_mode)
+
+        args = req.args
+        if args is not None and not isinstance(args, NetmikoSendCommandArgs):
+            args = NetmikoSendCommandArgs.model_validate(args, from_attributes=True)
+        return cls(
+            args=args,
+            conn_args=cls._coerce_connection_args(req.connection_args),
+            enabled=bool(getattr(req, "enable_mode", False)),
+        )
 
     @classmethod
     def from_pushing_request(cls, req: NetmikoPushingRequest):
-        if not isinstance(req, NetmikoPushingRequest):
-            req = NetmikoPushingRequest.model_validate(obj=req.model_dump())
+        if isinstance(req, NetmikoPushingRequest):
+            return cls(
+                args=req.args,
+                conn_args=req.connection_args,
+                enabled=req.enable_mode,
+                save=req.save,
+            )
+
+        args = req.args
+        if args is not None and not isinstance(args, NetmikoSendConfigSetArgs):
+            args = NetmikoSendConfigSetArgs.model_validate(args, from_attributes=True)
         return cls(
-            args=req.args,
-            conn_args=req.connection_args,
-            enabled=req.enable_mode,
-            save=req.save,
+            args=args,
+            conn_args=cls._coerce_connection_args(req.connection_args),
+            enabled=bool(getattr(req, "enable_mode", False)),
+            save=bool(getattr(req, "save", False)),
         )
 
     def __init__(
@@ -174,42 +396,168 @@ class NetmikoDriver(BaseDriver):
         self.enabled = enabled
         self.save = save
 
+        # The pool entry backing the session returned by connect()
+        self._entry: Optional[_PooledSession] = None
+
+        # args/conn_args are invariant after construction, so serialize them
+        # once instead of per command. Going through model_dump_json + orjson
+        # keeps the whole dump in native code (pydantic-core serializes, orjson
+        # parses) instead of pydantic's Python-level tree walk; both models are
+        # flat scalar dicts so the round-trip is lossless. `exclude_none` also
+        # shrinks the kwargs handed to netmiko (None values just shadow
+        # netmiko's own defaults).
+        self._args_dump = orjson.loads(args.model_dump_json(exclude_none=True)) if args else None
+        self._conn_dump = orjson.loads(conn_args.model_dump_json(exclude_none=True))
+
+        # Batched send is only safe when no per-command parsing is requested.
+        # `batch` is our own flag; netmiko must not see it in the kwargs.
+        self._batch = bool(
+            isinstance(args, NetmikoSendCommandArgs)
+            and args.batch
+            and not (args.use_textfsm or args.use_ttp or args.use_genie or args.expect_string)
+        )
+        if self._args_dump:
+            self._args_dump.pop("batch", None)
+
     def connect(self) -> BaseConnection:
+        cls = type(self)
         try:
-            session = self._get_persisted_session(self.conn_args)
-            if session:
-                log.info("Reusing existing connection")
+            entry = cls._get_pooled_session(self.conn_args)
+            if entry:
+                log.info("Reusing pooled connection")
             else:
                 log.info(f"Creating new connection to {self.conn_args.host}...")
-                session = ConnectHandler(**self.conn_args.model_dump())
+                factory = cls._connection_factory(self.conn_args.device_type)
+                session = factory(**self._conn_dump)
+                entry = _PooledSession(
+                    session=session,
+                    conn_args=self.conn_args,
+                    key=cls._pool_key(self.conn_args),
+                    last_io=time.monotonic(),
+                )
                 if self.conn_args.keepalive:
-                    self._set_persisted_session(session, self.conn_args)
-            return session
+                    cls._put_pooled_session(entry)
+            self._entry = entry
+            return entry.session
         except Exception as e:
             log.error(f"Error in connecting: {e}")
             raise e
 
+    def _session_entry(self, session: BaseConnection) -> _PooledSession:
+        """
+        Get the pool entry for a session. Sessions not created by connect()
+        get a transient (unpooled, unmonitored) entry so that locking and
+        keepalive bookkeeping stay uniform.
+        """
+        if self._entry and self._entry.session is session:
+            return self._entry
+
+        self._entry = _PooledSession(
+            session=session,
+            conn_args=self.conn_args,
+            key=type(self)._pool_key(self.conn_args),
+            last_io=time.monotonic(),
+        )
+        return self._entry
+
     def send(self, session: BaseConnection = None, command: Optional[list[str]] = None):
+        entry = self._session_entry(session)
+        entry.in_flight += 1
         try:
-            with self._monitor_lock:
-                if self.enabled:
+            if self.enabled:
+                with entry.channel_lock:
                     session.enable()
 
+            result = None
+            if self._batch and len(command) > 1:
+                result = self._send_batched(session, command, entry)
+
+            if result is None:
                 result = {}
                 for cmd in command:
-                    if self.args:
-                        response = session.send_command(cmd, **self.args.model_dump())
-                    else:
-                        response = session.send_command(cmd)
+                    # Hold the lock per command, so the monitor can slip in
+                    # between commands of a long batch.
+                    with entry.channel_lock:
+                        if self._args_dump:
+                            response = session.send_command(cmd, **self._args_dump)
+                        else:
+                            response = session.send_command(cmd)
+                        entry.last_io = time.monotonic()
                     result[cmd] = response
 
-                if self.enabled:
+            if self.enabled:
+                with entry.channel_lock:
                     session.exit_enable_mode()
 
             return result
         except Exception as e:
             log.error(f"Error in sending command: {e}")
             raise e
+        finally:
+            entry.in_flight -= 1
+
+    def _send_batched(
+        self, session: BaseConnection, command: list[str], entry: _PooledSession
+    ) -> Optional[dict]:
+        """
+        Write all commands in one go and read the output back in a single
+        prompt-delimited pass, collapsing N round-trips into ~1.
+
+        Returns None when the output cannot be confidently split per command;
+        the caller then falls back to the per-command path.
+        """
+        read_timeout = (self._args_dump or {}).get("read_timeout", 10.0)
+        pattern = None
+        wrote = False
+        try:
+            with entry.channel_lock:
+                prompt = session.find_prompt()
+                pattern = re.escape(prompt)
+                wrote = True
+                session.write_channel(session.RETURN.join(command) + session.RETURN)
+                output = ""
+                for _ in command:
+                    output += session.read_until_pattern(pattern=pattern, read_timeout=read_timeout)
+                entry.last_io = time.monotonic()
+        except Exception as e:
+            log.warning(f"Error in batched send, falling back to per-command: {e}")
+            if wrote:
+                # The device may still be streaming replies to commands we
+                # never read back; clean the channel first, or the fallback
+                # below would consume those stale bytes.
+                self._resync_channel(session, entry)
+            return None
+
+        # One chunk per command, plus whatever trails the last prompt
+        chunks = re.split(pattern, output)
+        if len(chunks) != len(command) + 1:
+            log.debug("Batched output does not split per command, falling back")
+            # The split failing means our view of the channel is off; drop
+            # anything still buffered before retrying per command.
+            self._resync_channel(session, entry)
+            return None
+
+        result = {}
+        for cmd, chunk in zip(command, chunks[:-1]):
+            # Strip the echoed command from the head of its chunk
+            lines = chunk.splitlines()
+            if lines and cmd.strip() in lines[0]:
+                lines = lines[1:]
+            result[cmd] = "\n".join(lines).strip()
+
+        return result
+
+    def _resync_channel(self, session: BaseConnection, entry: _PooledSession):
+        """
+        Drain leftover output and re-anchor on a fresh prompt after a
+        half-read batch. Errors propagate: if the channel cannot be
+        recovered, failing the job beats returning misattributed output.
+        """
+        with entry.channel_lock:
+            if junk := session.clear_buffer():
+                log.debug(f"Dropped stale output while resyncing: {junk!r}")
+            session.find_prompt()
+            entry.last_io = time.monotonic()
 
     def config(
         self,
@@ -220,13 +568,17 @@ class NetmikoDriver(BaseDriver):
         Send -> (Commit) -> Save
         Some devices may not support commit.
         """
+        entry = self._session_entry(session)
+        entry.in_flight += 1
         try:
-            with self._monitor_lock:
+            # Unlike send(), the whole send -> commit -> save sequence is one
+            # transaction on the channel, so keep the lock for its duration.
+            with entry.channel_lock:
                 if self.enabled:
                     session.enable()
 
-                if self.args:
-                    response = [session.send_config_set(config, **self.args.model_dump())]
+                if self._args_dump:
+                    response = [session.send_config_set(config, **self._args_dump)]
                 else:
                     response = [session.send_config_set(config)]
 
@@ -240,17 +592,21 @@ class NetmikoDriver(BaseDriver):
                 if self.enabled:
                     session.exit_enable_mode()
 
+                entry.last_io = time.monotonic()
+
             return response
         except Exception as e:
             log.error(f"Error in sending config: {e}")
             raise e
+        finally:
+            entry.in_flight -= 1
 
     def _commit(self, session: BaseConnection) -> Optional[str]:
         """
         Commit the configuration.
         This should be called after sending the configuration.
 
-        NOTE: Caller should own the lock!
+        NOTE: Caller should own the channel lock!
         NOTE: Some devices may not support commit. In this case, the running-config
         is already updated.
         """
@@ -263,21 +619,22 @@ class NetmikoDriver(BaseDriver):
 
     def disconnect(self, session: BaseConnection, reset=False):
         """
-        Disconnect the session and stop monitor thread.
+        Disconnect the session and stop its monitor thread.
         """
         # We only disconnect if reset is True, so that we can reuse the connection
         if not reset:
             return
 
-        with self._monitor_lock:
-            try:
-                # Stop monitor thread and disconnect
-                session.disconnect()
-            except Exception as e:
-                log.error(f"Error in disconnecting (reset): {e}")
-                raise e
-            finally:
-                self._set_persisted_session(None, self.conn_args)
+        cls = type(self)
+        entry = self._session_entry(session)
+        with cls._pool_lock:
+            if cls._pool.get(entry.key) is entry:
+                del cls._pool[entry.key]
+
+        try:
+            cls._teardown_entry(entry)
+        finally:
+            self._entry = None
 
 
 __all__ = ["NetmikoDriver"]
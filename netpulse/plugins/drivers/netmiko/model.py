@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 from pydantic import ConfigDict
@@ -64,6 +65,15 @@ class NetmikoConnectionArgs(DriverConnectionArgs):
         }
     )
 
+    @cached_property
+    def _identity_key(self) -> tuple:
+        """
+        Hashable device identity, computed once per instance. Cheaper than
+        pydantic's generated __eq__ (which compares every field) when used
+        as a session-pool key on the connect() fast path.
+        """
+        return (self.device_type, self.host, self.port, self.username)
+
 
 class NetmikoSendCommandArgs(DriverArgs):
     """
@@ -86,6 +96,11 @@ class NetmikoSendCommandArgs(DriverArgs):
     cmd_verify: bool = True
     raise_parsing_error: bool = False
 
+    # NetPulse extension (not passed to netmiko): write all commands in one
+    # go and split the output by prompt, collapsing N round-trips into ~1.
+    # Ignored when per-command parsing (textfsm/ttp/genie) is requested.
+    batch: bool = False
+
 
 class NetmikoSendConfigSetArgs(DriverArgs):
     """
@@ -1,14 +1,19 @@
+import json
 import logging
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Callable, Optional
 
 from rq import Queue, Worker
-from rq.command import send_shutdown_command
+from rq.command import PUBSUB_CHANNEL_TEMPLATE
 from rq.exceptions import InvalidJobOperation, NoSuchJobError
-from rq.job import Job
+from rq.job import Callback, Job
 from rq.registry import FailedJobRegistry, FinishedJobRegistry, StartedJobRegistry
+from rq.utils import as_text, utcparse
 
+import orjson
 import redis
 import redis.client
 
@@ -42,6 +47,18 @@ class Manager:
     Job, Queue and Worker Manager
     """
 
+    # How long a queue-liveness result stays valid (seconds). One dispatch
+    # can check the same queue several times; within this window the result
+    # cannot meaningfully change.
+    _ALIVE_CACHE_TTL = 0.5
+
+    # How long the node-info snapshot stays valid (seconds). Scheduling
+    # retries and overlapping dispatches then share one HGETALL.
+    _NODES_CACHE_TTL = 0.25
+
+    # Upper bound for cached Queue objects (pinned queues are per-host)
+    _QUEUE_CACHE_CAP = 256
+
     def __init__(self):
         self.job_timeout: int = g_config.job.timeout
         self.job_result_ttl: int = g_config.job.result_ttl
@@ -64,6 +81,54 @@ class Manager:
         # Redis connection
         self.rdb = g_rdb.conn
 
+        # q_name -> (checked_at, alive); see _check_worker_alive
+        self._alive_cache: dict[str, tuple[float, bool]] = {}
+
+        # (fetched_at, nodes); see get_all_nodes
+        self._nodes_cache: Optional[tuple[float, list[NodeInfo]]] = None
+
+        # q_name -> Queue; see _get_queue
+        self._queue_cache: OrderedDict[str, Queue] = OrderedDict()
+
+        # Default job meta, dumped once; enqueue paths copy it per job
+        # instead of instantiating and dumping the model every time
+        self._meta_template: dict = JobAdditionalData().model_dump()
+
+        # Fuses the host->node and node->info lookups of
+        # _get_assigned_node_for_host into one round-trip. Both keys live
+        # on the same instance in the standalone and sentinel deployments
+        # we support, so a script is safe here.
+        self._assigned_node_script = self.rdb.register_script(
+            """
+            local names = redis.call('HMGET', KEYS[1], unpack(ARGV))
+            local infos = {}
+            for i, name in ipairs(names) do
+                if name then
+                    infos[i] = redis.call('HGET', KEYS[2], name)
+                else
+                    infos[i] = false
+                end
+            end
+            return infos
+            """
+        )
+
+    def _get_queue(self, q_name: str) -> Queue:
+        """
+        Queue objects are just handles (name + connection); reuse one per
+        name instead of allocating a new object on every call. LRU-bounded
+        so a long tail of per-host pinned queues does not grow forever.
+        """
+        q = self._queue_cache.get(q_name)
+        if q is None:
+            q = Queue(q_name, connection=self.rdb)
+            self._queue_cache[q_name] = q
+            if len(self._queue_cache) > self._QUEUE_CACHE_CAP:
+                self._queue_cache.popitem(last=False)
+        else:
+            self._queue_cache.move_to_end(q_name)
+        return q
+
     def _check_worker_alive(self, q_name: str) -> bool:
         """
         Check if a worker is alive in the queue
@@ -71,28 +136,51 @@ class Manager:
         From controller side, we totally rely on the worker's heartbeat.
         However, if the job is blocking, the worker will not send heartbeat.
         So we have to consider the job's ttl as well.
-        """
-        workers = Worker.all(queue=Queue(q_name, connection=self.rdb))
 
-        def is_alive(w: Worker):
-            if w.death_date:
+        Results are cached for _ALIVE_CACHE_TTL to amortize the Redis reads
+        across the repeated checks of a single dispatch. Paths that change
+        worker liveness themselves (node deletion, worker launch) drop the
+        affected entries.
+        """
+        cached = self._alive_cache.get(q_name)
+        if cached and time.monotonic() - cached[0] < self._ALIVE_CACHE_TTL:
+            return cached[1]
+
+        keys = Worker.all_keys(connection=self.rdb, queue=self._get_queue(q_name))
+
+        # Only three fields matter here, so fetch them for all workers in
+        # one pipelined round-trip instead of Worker.all()'s full per-worker
+        # hydration (HGETALL each, plus an extra HGET for the death date).
+        heartbeats = []
+        if keys:
+            with self.rdb.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hmget(key, "death", "last_heartbeat", "state")
+                heartbeats = pipe.execute()
+
+        now = datetime.now(timezone.utc)
+
+        def is_alive(death, last_heartbeat, state):
+            if death or not last_heartbeat:
                 return False
 
-            interval = w.last_heartbeat.astimezone(timezone.utc) - datetime.now(timezone.utc)
-            interval = interval.total_seconds()
+            heartbeat = utcparse(as_text(last_heartbeat))
+            # rq stores heartbeats in UTC; only convert the odd one out
+            if heartbeat.tzinfo is not timezone.utc:
+                heartbeat = heartbeat.astimezone(timezone.utc)
+            interval = (heartbeat - now).total_seconds()
 
-            state = w.get_state()
-            if state == "busy":
+            if state and as_text(state) == "busy":
                 return interval <= max(self.job_timeout, self.worker_ttl) + 5
             else:
                 return interval <= self.worker_ttl + 5
 
-        for w in workers:
-            if is_alive(w):
-                return True
+        alive = any(is_alive(*heartbeat) for heartbeat in heartbeats)
+        if not alive:
+            log.debug(f"{q_name} has no alive worker")
 
-        log.debug(f"{q_name} has no alive worker")
-        return False
+        self._alive_cache[q_name] = (time.monotonic(), alive)
+        return alive
 
     def _get_assigned_node_for_host(
         self, hosts: str | list[str]
@@ -107,23 +195,33 @@ class Manager:
         is_single = isinstance(hosts, str)
         hosts = [hosts] if isinstance(hosts, str) else hosts
 
-        host_mappings = self.rdb.hmget(self.host_to_node_map, hosts)
-        if not any(host_mappings):
-            return None if is_single else [None] * len(hosts)
+        # Both hash lookups happen server-side in one round-trip; results
+        # are indexed by host position (None for unassigned hosts).
+        node_values = None
+        try:
+            node_values = self._assigned_node_script(
+                keys=[self.host_to_node_map, self.node_info_map], args=hosts
+            )
+        except redis.RedisError as e:
+            log.debug(f"Assigned-node script failed, falling back to HMGET: {e}")
 
-        # Preserve the order
-        valid_data = [
-            (idx, mapping) for idx, mapping in enumerate(host_mappings) if mapping is not None
-        ]
+        if node_values is None:
+            host_mappings = self.rdb.hmget(self.host_to_node_map, hosts)
+            node_keys = [mapping for mapping in host_mappings if mapping is not None]
+            if not node_keys:
+                # Nothing assigned: skip the second HMGET entirely
+                return None if is_single else [None] * len(hosts)
 
-        node_keys = [mapping for _, mapping in valid_data]
-        node_values = self.rdb.hmget(self.node_info_map, node_keys) if node_keys else []
+            values = iter(self.rdb.hmget(self.node_info_map, node_keys))
+            node_values = [
+                next(values) if mapping is not None else None for mapping in host_mappings
+            ]
 
         final_results = [None] * len(hosts)
-        for (idx, _), value in zip(valid_data, node_values):
+        for idx, value in enumerate(node_values):
             if value:
                 try:
-                    final_results[idx] = NodeInfo.model_validate_json(value)
+                    final_results[idx] = self._parse_node(value)
                 except Exception as e:
                     log.error(f"Error in validating node info: {e}")
                     raise e
@@ -155,6 +253,10 @@ class Manager:
             kwargses=kwargses,
         )
 
+        # A worker may come up on these queues any moment now
+        for k in kwargses:
+            self._alive_cache.pop(k["q_name"], None)
+
         return kwargses[0]["q_name"] if is_single else [k["q_name"] for k in kwargses]
 
     def _force_delete_node(self, node: NodeInfo):
@@ -167,25 +269,81 @@ class Manager:
         However, if the node is forced killed/disconnected, we have
         to clean up for the node.
         """
-        keys_to_delete = []
-        for host, node_name in self.rdb.hscan_iter(self.host_to_node_map):
-            if node_name.decode() == node.hostname:
-                keys_to_delete.append(host.decode())
+        # Large COUNT hint keeps the scan to a few round-trips; comparing
+        # raw bytes avoids decoding every field of a large map.
+        node_name = node.hostname.encode()
+        keys_to_delete = [
+            host
+            for host, mapped in self.rdb.hscan_iter(self.host_to_node_map, count=2000)
+            if mapped == node_name
+        ]
 
         with self.rdb.pipeline() as pipe:
-            if len(keys_to_delete):
-                pipe.hdel(self.host_to_node_map, *keys_to_delete)
+            # Chunked so one HDEL does not grow unbounded with the map
+            for i in range(0, len(keys_to_delete), 500):
+                pipe.hdel(self.host_to_node_map, *keys_to_delete[i : i + 500])
 
             pipe.hdel(self.node_info_map, node.hostname)
             pipe.execute()
 
         # Remove all running workers
+        worker_names = []
         for host in keys_to_delete:
-            q_name = g_config.get_host_queue_name(host)
-            workers = Worker.all(queue=Queue(q_name, connection=self.rdb))
-            # assert len(workers) == 1
-            for w in workers:
-                send_shutdown_command(worker_name=w.name, connection=self.rdb)
+            q_name = g_config.get_host_queue_name(host.decode())
+            self._alive_cache.pop(q_name, None)
+            # assert len(keys) == 1
+            keys = Worker.all_keys(connection=self.rdb, queue=self._get_queue(q_name))
+            worker_names.extend(self._worker_name_from_key(k) for k in keys)
+
+        self._send_shutdown_commands(worker_names)
+
+        self._alive_cache.pop(node.queue, None)
+        self._nodes_cache = None
+
+    @staticmethod
+    def _parse_node(value: bytes | str) -> NodeInfo:
+        """
+        Hydrate a NodeInfo from its stored JSON. The JSON is written by
+        NodeWorker from this very model, so orjson plus model_construct
+        skip pydantic's validation pass on trusted internal data.
+        """
+        return NodeInfo.model_construct(**orjson.loads(value))
+
+    @staticmethod
+    def _worker_name_from_key(key: str) -> str:
+        return key[len(Worker.redis_worker_namespace_prefix) :]
+
+    def _send_shutdown_commands(self, worker_names: list[str]):
+        """
+        Pipelined equivalent of rq's send_shutdown_command: one PUBLISH per
+        worker, all flushed in a single round-trip.
+        """
+        if not worker_names:
+            return
+
+        payload = json.dumps({"command": "shutdown"})
+        with self.rdb.pipeline(transaction=False) as pipe:
+            for name in worker_names:
+                pipe.publish(PUBSUB_CHANNEL_TEMPLATE % name, payload)
+            pipe.execute()
+
+    def _wrap_callbacks(
+        self, on_success: Optional[Callable], on_failure: Optional[Callable]
+    ) -> tuple[Optional[Callback], Optional[Callback]]:
+        """
+        Wrap success/failure handlers (with timeout) into rq Callback
+        objects. Already-wrapped callbacks pass through unchanged, so batch
+        paths can wrap once and reuse the pair for every job.
+        """
+        if not on_failure:
+            on_failure = rpc_exception_callback
+
+        if not isinstance(on_success, Callback):
+            on_success = rpc_callback_factory(on_success, timeout=self.job_timeout)
+        if not isinstance(on_failure, Callback):
+            on_failure = rpc_callback_factory(on_failure, timeout=self.job_timeout)
+
+        return on_success, on_failure
 
     def _send_job(
         self,
@@ -197,14 +355,9 @@ class Manager:
         on_failure: Optional[Callable] = None,
         pipeline: redis.client.Pipeline = None,
     ):
-        if not on_failure:
-            on_failure = rpc_exception_callback
-
-        # Wraps the function with timeout in a Callback object
-        on_success = rpc_callback_factory(on_success, timeout=self.job_timeout)
-        on_failure = rpc_callback_factory(on_failure, timeout=self.job_timeout)
+        on_success, on_failure = self._wrap_callbacks(on_success, on_failure)
 
-        q = Queue(q_name, connection=self.rdb)
+        q = self._get_queue(q_name)
         job = q.enqueue_call(
             func=func,
             timeout=self.job_timeout,  # time limit for job execution
@@ -212,7 +365,7 @@ class Manager:
             result_ttl=self.job_result_ttl,  # result ttl in redis
             failure_ttl=self.job_result_ttl,  # errors ttl in redis
             kwargs=kwargs,
-            meta=JobAdditionalData().model_dump(),
+            meta=dict(self._meta_template),
             on_success=on_success,
             on_failure=on_failure,
             pipeline=pipeline,
@@ -228,19 +381,16 @@ class Manager:
         ttl: Optional[int] = None,
         on_success: Optional[Callable] = None,
         on_failure: Optional[Callable] = None,
+        pipeline: redis.client.Pipeline = None,
     ):
         """
         Send multiple jobs to a single queue.
-        Pipeline is auto created in this method.
+        Pipeline is auto created if not given; when given, the caller
+        must execute it.
         """
         assert len(funcs) == len(kwargses), "Function and kwargs mismatch"
 
-        if not on_failure:
-            on_failure = rpc_exception_callback
-
-        # Wraps the function with timeout in a Callback object
-        on_success = rpc_callback_factory(on_success, timeout=self.job_timeout)
-        on_failure = rpc_callback_factory(on_failure, timeout=self.job_timeout)
+        on_success, on_failure = self._wrap_callbacks(on_success, on_failure)
 
         jobs = []
         for func, kwargs in zip(funcs, kwargses):
@@ -251,14 +401,14 @@ class Manager:
                 result_ttl=self.job_result_ttl,  # result ttl in redis
                 failure_ttl=self.job_result_ttl,  # errors ttl in redis
                 kwargs=kwargs,
-                meta=JobAdditionalData().model_dump(),
+                meta=dict(self._meta_template),
                 on_success=on_success,
                 on_failure=on_failure,
             )
             jobs.append(job)
 
-        q = Queue(q_name, connection=self.rdb)
-        jobs = q.enqueue_many(jobs)
+        q = self._get_queue(q_name)
+        jobs = q.enqueue_many(jobs, pipeline=pipeline)
 
         return jobs
 
@@ -271,19 +421,26 @@ class Manager:
         if not node_info:
             return None
 
-        return NodeInfo.model_validate_json(node_info)
+        return self._parse_node(node_info)
 
     def get_all_nodes(self) -> list[NodeInfo]:
         """
         Get all nodes from the redis
+
+        The result is cached for _NODES_CACHE_TTL: the dispatch retry loops
+        call this repeatedly and `node_info_map` is the largest HGETALL on
+        the hot path. Force-deleting a node drops the cache.
         """
+        if self._nodes_cache and time.monotonic() - self._nodes_cache[0] < self._NODES_CACHE_TTL:
+            return self._nodes_cache[1]
+
         # check the map in redis
         nodes = self.rdb.hgetall(self.node_info_map)
-        if not nodes:
-            return []
 
         # key: hostname of the node, value: node info
-        return [NodeInfo.model_validate_json(node) for node in nodes.values()]
+        result = [self._parse_node(node) for node in nodes.values()]
+        self._nodes_cache = (time.monotonic(), result)
+        return result
 
     def dispatch_rpc_job(
         self,
@@ -431,49 +588,80 @@ class Manager:
 
             assert len(selected_nodes) == len(unassigned_hosts), "Host and Node scheduling mismatch"
 
-            # Appending indexes of original list
-            node_group: dict[int, list[int]] = defaultdict(list)
+            # Group host indexes by their selected node (keyed by hostname),
+            # so each node is liveness-checked and launched once for all of
+            # its hosts instead of once per host.
+            node_group: dict[str, list[int]] = defaultdict(list)
+            node_by_name: dict[str, NodeInfo] = {}
             for idx, n in enumerate(selected_nodes):
                 if not n:
                     failed_hosts.add(unassigned_hosts[idx])
                 else:
-                    node_group[idx].append(unassigned_hosts[idx])
-
-            for idx, ids in node_group.items():
-                n = selected_nodes[idx]
+                    node_by_name[n.hostname] = n
+                    node_group[n.hostname].append(unassigned_hosts[idx])
 
+            def launch(n: NodeInfo, ids: list[int]):
                 # If node is not available, all assigned hosts are failed.
                 if not self._check_worker_alive(n.queue):
                     log.warning(f"Node {n.hostname} is not available, force deleting...")
                     self._force_delete_node(n)
                     failed_hosts.update(ids)
-                    continue
+                    return
 
                 try:
                     _ = self._try_launch_pinned_worker(hosts=[hosts[i] for i in ids], node=n)
                 except Exception as e:
                     log.error(f"Error in launching pinned worker for {ids}: {e}")
                     failed_hosts.update(ids)
+
+            # Each launch costs at least one Redis round-trip per node, so
+            # fan out across nodes instead of paying them serially. redis-py
+            # hands each thread its own pooled connection.
+            if len(node_group) == 1:
+                name, ids = next(iter(node_group.items()))
+                launch(node_by_name[name], ids)
+            elif node_group:
+                with ThreadPoolExecutor(max_workers=min(8, len(node_group))) as pool:
+                    futures = [
+                        pool.submit(launch, node_by_name[name], ids)
+                        for name, ids in node_group.items()
+                    ]
+                # Surface exceptions (e.g. from the liveness check) just
+                # like the serial path would; submit alone swallows them.
+                for f in futures:
+                    f.result()
             break
 
         # Send out all jobs except failed ones
         def send(host_ids: list[int]) -> tuple[list[Job], list[int]]:
             succeeded = []
             failed = []
+
+            # Group by target queue so every group takes rq's bulk
+            # enqueue_many path (unique per host for pinned queues, but
+            # shared when hosts collapse onto one queue). All groups are
+            # still flushed in one shared pipeline.
+            queue_group: dict[str, list[int]] = defaultdict(list)
+            for idx in host_ids:
+                queue_group[g_config.get_host_queue_name(hosts[idx])].append(idx)
+
+            # Wrap once for the whole batch, not once per queue group
+            wrapped_success, wrapped_failure = self._wrap_callbacks(on_success, on_failure)
+
             try:
                 with self.rdb.pipeline() as pipe:
-                    succeeded = [
-                        self._send_job(
-                            q_name=g_config.get_host_queue_name(hosts[idx]),
-                            ttl=ttl,
-                            func=func,
-                            kwargs=kwargses[idx],
-                            on_success=on_success,
-                            on_failure=on_failure,
-                            pipeline=pipe,
+                    for q_name, ids in queue_group.items():
+                        succeeded.extend(
+                            self._send_batch_jobs(
+                                q_name=q_name,
+                                funcs=[func] * len(ids),
+                                kwargses=[kwargses[i] for i in ids],
+                                ttl=ttl,
+                                on_success=wrapped_success,
+                                on_failure=wrapped_failure,
+                                pipeline=pipe,
+                            )
                         )
-                        for idx in host_ids
-                    ]
                     pipe.execute(raise_on_error=True)
             except Exception as e:
                 log.warning(f"Error in sending batch jobs: {e}")
@@ -482,8 +670,20 @@ class Manager:
             finally:
                 return succeeded, failed
 
-        succeeded, failed = send(list(set(unassigned_hosts) - failed_hosts) + assigned_hosts)
-        failed.extend(list(failed_hosts))
+        # Ordered send list via a boolean mask instead of set algebra: a
+        # host is sent when it was assigned up front, or was scheduled
+        # above and did not fail. Index order keeps hosts[idx]/kwargses[idx]
+        # reads sequential in send().
+        ok_mask = bytearray(len(hosts))
+        for idx in assigned_hosts:
+            ok_mask[idx] = 1
+        for idx in unassigned_hosts:
+            ok_mask[idx] = 1
+        for idx in failed_hosts:
+            ok_mask[idx] = 0
+
+        succeeded, failed = send([idx for idx, ok in enumerate(ok_mask) if ok])
+        failed.extend(failed_hosts)
 
         return [JobInResponse.from_job(job) for job in succeeded], [hosts[i] for i in failed]
 
@@ -569,15 +769,24 @@ class Manager:
             on_failure=failure_handler,
         )
 
-    def _get_all_job_id(self):
-        keys = self.rdb.keys(f"{Job.redis_job_namespace_prefix}*")
-        return [k.decode().split(":")[-1] for k in keys]
+    def _get_all_job_id(self, limit: Optional[int] = None):
+        """
+        Stream job ids with SCAN instead of KEYS: KEYS blocks Redis while
+        walking the whole keyspace. With a limit, stop as soon as enough
+        ids are collected.
+        """
+        ids = []
+        for k in self.rdb.scan_iter(match=f"{Job.redis_job_namespace_prefix}*", count=2000):
+            ids.append(k.decode().rsplit(":", 1)[-1])
+            if limit and len(ids) >= limit:
+                break
+        return ids
 
     def _get_job_id_by_status(self, state: str, q_name: str):
         """
         status can only be filtered by one queue name
         """
-        q = Queue(q_name, connection=self.rdb)
+        q = self._get_queue(q_name)
 
         registry = None
         if state == "started":
@@ -601,8 +810,6 @@ class Manager:
             log.error(f"Invalid state: {state}")
             return []
 
-        all_job_ids = []
-
         # Get all unique queue names from active workers
         queue_names = set()
         workers = Worker.all(connection=self.rdb)
@@ -612,35 +819,46 @@ class Manager:
         # Also include common queue names that might not have active workers
         queue_names.add(g_config.get_fifo_queue_name())  # FifoQ
 
-        # For queued status, we need to check the queue itself, not a registry
-        if state == "queued":
+        registry_cls = {
+            "started": StartedJobRegistry,
+            "finished": FinishedJobRegistry,
+            "failed": FailedJobRegistry,
+        }
+
+        # One LRANGE/ZRANGE per queue, all in a single pipelined round-trip.
+        # Reading the registry keys directly skips get_job_ids()'s per-call
+        # cleanup; ids of already-expired jobs are filtered out later when
+        # the jobs fail to fetch.
+        with self.rdb.pipeline(transaction=False) as pipe:
             for q_name in queue_names:
-                try:
-                    q = Queue(q_name, connection=self.rdb)
-                    queued_jobs = q.get_job_ids()
-                    all_job_ids.extend(queued_jobs)
-                except Exception as e:
-                    log.debug(f"Error getting queued jobs from queue {q_name}: {e}")
-                    continue
-        else:
-            # For other states, use registries
-            for q_name in queue_names:
-                try:
-                    job_ids = self._get_job_id_by_status(state, q_name)
-                    all_job_ids.extend(job_ids)
-                except Exception as e:
-                    log.debug(f"Error getting {state} jobs from queue {q_name}: {e}")
-                    continue
+                q = self._get_queue(q_name)
+                # For queued status, check the queue itself, not a registry
+                if state == "queued":
+                    pipe.lrange(q.key, 0, -1)
+                else:
+                    pipe.zrange(registry_cls[state](queue=q).key, 0, -1)
+            results = pipe.execute()
 
-        return list(set(all_job_ids))  # Remove duplicates
+        # Remove duplicates
+        return list({as_text(job_id) for ids in results for job_id in ids})
 
-    def get_job_list_by_ids(self, job_ids: list[str]):
-        """Fetch and render a list of jobs"""
-        return [
-            JobInResponse.from_job(j)
-            for j in Job.fetch_many(job_ids, connection=self.rdb)
-            if j is not None
-        ]
+    def get_job_list_by_ids(self, job_ids: list[str], limit: Optional[int] = None):
+        """
+        Fetch and render a list of jobs.
+
+        Fetches in chunks of 500 ids and stops as soon as `limit` rendered
+        jobs are collected, so a small limit against a large id list does
+        not materialize every job.
+        """
+        jobs = []
+        for i in range(0, len(job_ids), 500):
+            for j in Job.fetch_many(job_ids[i : i + 500], connection=self.rdb):
+                if j is None:
+                    continue
+                jobs.append(JobInResponse.from_job(j))
+                if limit and len(jobs) >= limit:
+                    return jobs
+        return jobs
 
     def get_job_list(
         self,
@@ -653,18 +871,18 @@ class Manager:
             # Status must be filtered with a queue name
             if status:
                 job_ids = self._get_job_id_by_status(status, q_name)
-                return self.get_job_list_by_ids(job_ids)[:limit] if job_ids else []
+                return self.get_job_list_by_ids(job_ids, limit=limit) if job_ids else []
 
-            q = Queue(q_name, connection=self.rdb)
+            q = self._get_queue(q_name)
             jobs = [JobInResponse.from_job(j) for j in q.get_jobs(length=limit if limit else -1)]
             return jobs[:limit] if limit else jobs
 
         # Handle status filtering without queue name
         if status:
             job_ids = self._get_job_id_by_status_all_queues(status)
-            return self.get_job_list_by_ids(job_ids)[:limit] if job_ids else []
+            return self.get_job_list_by_ids(job_ids, limit=limit) if job_ids else []
 
-        jobs = self._get_all_job_id()[:limit]
+        jobs = self._get_all_job_id(limit=limit)
         return self.get_job_list_by_ids(jobs) if jobs else []
 
     def cancel_job(self, id: Optional[str] = None, q_name: Optional[str] = None):
@@ -690,11 +908,21 @@ class Manager:
         if not q_name:
             return cancelled
 
-        q = Queue(q_name, connection=self.rdb)
-        for j in q.get_jobs():
-            if j.get_status() == "queued":
-                j.cancel()
-                cancelled.append(j.id)
+        # Jobs still on the queue list are queued by definition, so no
+        # per-job get_status() round-trip is needed. All cancellations are
+        # buffered into one pipeline and flushed in a single round-trip.
+        q = self._get_queue(q_name)
+        jobs = Job.fetch_many(q.get_job_ids(), connection=self.rdb)
+        with self.rdb.pipeline(transaction=False) as pipe:
+            for j in jobs:
+                if j is None:
+                    continue
+                try:
+                    j.cancel(pipeline=pipe)
+                    cancelled.append(j.id)
+                except InvalidJobOperation as e:
+                    log.warning(f"Error in cancelling job {j.id}: {e}")
+            pipe.execute()
 
         return cancelled
 
@@ -703,7 +931,7 @@ class Manager:
         if q_name is None:
             workers = Worker.all(connection=self.rdb)
         else:
-            workers = Worker.all(queue=Queue(q_name, connection=self.rdb))
+            workers = Worker.all(queue=self._get_queue(q_name))
         return [WorkerInResponse.from_worker(w) for w in workers]
 
     def kill_worker(
@@ -713,17 +941,17 @@ class Manager:
         Kill workers by name. If name not given, use queue name.
         """
         if name:
-            send_shutdown_command(worker_name=name, connection=self.rdb)
+            self._send_shutdown_commands([name])
             return [name]
 
         killed = []
         if not q_name:
             return killed
 
-        workers = Worker.all(queue=Queue(q_name, connection=self.rdb))
-        for w in workers:
-            send_shutdown_command(worker_name=w.name, connection=self.rdb)
-            killed.append(w.name)
+        # Only names are needed, so skip Worker.all()'s per-worker hydration
+        keys = Worker.all_keys(connection=self.rdb, queue=self._get_queue(q_name))
+        killed = [self._worker_name_from_key(k) for k in keys]
+        self._send_shutdown_commands(killed)
 
         return killed
 
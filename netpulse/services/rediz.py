@@ -61,6 +61,7 @@ class Rediz:
                     socket_keepalive=config.keepalive,
                     retry_on_timeout=True,
                     retry_on_error=[ConnectionError],
+                    health_check_interval=30,
                 )
             else:
                 log.info("Connecting to Redis master node without encryption")
@@ -71,6 +72,7 @@ class Rediz:
                     socket_keepalive=config.keepalive,
                     retry_on_timeout=True,
                     retry_on_error=[ConnectionError],
+                    health_check_interval=30,
                 )
 
             self.conn = master
@@ -110,6 +112,9 @@ class Rediz:
                     socket_keepalive=config.keepalive,
                     retry_on_timeout=True,
                     retry_on_error=[ConnectionError],
+                    # Amortized liveness check: PING only when a pooled
+                    # connection has been idle for this long
+                    health_check_interval=30,
                 )
             else:
                 log.info("Connecting to Redis without encryption")
@@ -121,6 +126,7 @@ class Rediz:
                     socket_keepalive=config.keepalive,
                     retry_on_timeout=True,
                     retry_on_error=[ConnectionError],
+                    health_check_interval=30,
                 )
 
             # Verify connection success
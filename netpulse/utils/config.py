@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -116,7 +117,10 @@ class AppConfig(BaseSettings):
         )
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_host_queue_name(host: str) -> str:
+        # Called per host on every dispatch; memoized since the mapping
+        # never changes for a given host
         return f"HostQ_{host}"
 
     @staticmethod
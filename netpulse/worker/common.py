@@ -1,9 +1,11 @@
 import logging
 import socket
+import threading
 
 from rq import Queue
 from rq.worker import BaseWorker, SimpleWorker
 
+from ..plugins.drivers import BaseDriver
 from ..services.rediz import g_rdb
 from ..utils import g_config
 
@@ -44,4 +46,20 @@ class RedisWorker:
 
         queue = Queue(q_name, connection=self.rdb)
         self._worker = SimpleWorker(queue, name=self.name, connection=self.rdb, worker_ttl=self.ttl)
+
+        # A driver may flag this worker for retirement (e.g. its persistent
+        # device connection died). Stop the loop cooperatively between jobs
+        # rather than tearing the process down with SIGTERM.
+        threading.Thread(target=self._watch_suicide_flag, daemon=True).start()
+
         self._worker.work()
+
+    def _watch_suicide_flag(self):
+        BaseDriver.suicide_flag.wait()
+        log.info(f"Worker {self.name} is flagged to retire, stopping after current job")
+        worker = self._worker
+        if worker:
+            # rq checks this flag after the running job and before each
+            # dequeue; when idle, the worker exits at the next dequeue
+            # timeout at the latest.
+            worker._stop_requested = True